@@ -0,0 +1,154 @@
+# src/evidence_index.py
+#
+# Builds the gene x structure evidence index used for heatmap drill-down.
+#
+# evidence.tsv holds one line per (Gene ID, structure ID) cell, sorted by key:
+#     <Gene ID>\t<structure ID>\t<JSON list of deduplicated evidence records>
+# evidence_index.json holds the first key and byte range of every block of
+# at most BLOCK_BYTES, so a reader binary-searches the blocks in memory and then
+# fetches exactly one block (one HTTP Range request in the dashboard).
+# evidence_names.json maps gene symbols and structure names to their IDs; it
+# is kept separate because it grows with the dump while the block index
+# stays small.
+#
+# Usage (from the repository root):
+#     python src/evidence_index.py               # build the index
+#     python src/evidence_index.py c3a.1 liver   # look up one heatmap cell
+
+import json
+import os
+import sys
+from bisect import bisect_right
+
+import pandas as pd
+
+from filter_expression import load_expression
+
+# --- Configuration ---
+DATA_FILE = "data/filtered_expression.csv"  # Also accepts the raw ZFIN .txt dump
+OUTPUT_DIR = "dashboard/evidence"
+EVIDENCE_FILE = "evidence.tsv"
+INDEX_FILE = "evidence_index.json"
+NAMES_FILE = "evidence_names.json"
+BLOCK_BYTES = 16 * 1024  # Max block size (one dashboard request); a larger cell gets its own block
+
+# Columns kept for each evidence record, in the order they are stored
+evidence_fields = [
+    "Publication ID", "Assay", "Probe ID", "Antibody ID",
+    "Fish ID", "Fish Name", "Start Stage", "End Stage"
+]
+
+
+def load_source(path):
+    """Load the filtered CSV, or a raw ZFIN .txt dump, with every column as text."""
+    if path.endswith(".txt"):
+        df = load_expression(path, dtype=str)
+    else:
+        df = pd.read_csv(path, dtype=str)
+        df.columns = df.columns.str.strip()
+    return df
+
+
+def build_cells(df):
+    """Map (Gene ID, structure ID) -> sorted, deduplicated evidence records.
+
+    Every row is filed under its super structure, and additionally under its
+    sub structure when the annotation has one.
+    """
+    df = df.dropna(subset=["Gene ID"])
+    records = df[evidence_fields].fillna("")
+    by_super = records.assign(key_gene=df["Gene ID"], key_structure=df["Super Structure ID"])
+    by_sub = records.assign(key_gene=df["Gene ID"], key_structure=df["Sub Structure ID"])
+    keyed = pd.concat([by_super, by_sub]).dropna(subset=["key_structure"])
+    keyed = keyed.drop_duplicates().sort_values(["key_gene", "key_structure"] + evidence_fields)
+
+    cells = {}
+    for (gene_id, structure_id), group in keyed.groupby(["key_gene", "key_structure"], sort=False):
+        cells[(gene_id, structure_id)] = group[evidence_fields].values.tolist()
+    return cells
+
+
+def write_index(df, output_dir=OUTPUT_DIR):
+    cells = build_cells(df)
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Write every file to a temp name first and swap them in at the end, so a
+    # dashboard reading while the watcher rebuilds never sees a partial file.
+    # The block index goes last, so a newly fetched index always describes
+    # the evidence.tsv already in place.
+    paths = [os.path.join(output_dir, name) for name in (EVIDENCE_FILE, NAMES_FILE, INDEX_FILE)]
+    evidence_path, names_path, index_path = paths
+
+    blocks = []
+    offset = 0
+    with open(evidence_path + ".tmp", "wb") as f:
+        for key in sorted(cells):
+            line = "\t".join(key) + "\t" + json.dumps(cells[key], separators=(",", ":")) + "\n"
+            line = line.encode("utf-8")
+            if not blocks or blocks[-1][3] + len(line) > BLOCK_BYTES:
+                blocks.append([key[0], key[1], offset, 0])
+            f.write(line)
+            offset += len(line)
+            blocks[-1][3] += len(line)
+
+    # Name lookups so the dashboard can translate heatmap labels into IDs
+    genes = df.dropna(subset=["Gene ID"]).drop_duplicates("Gene Symbol")
+    structures = pd.concat([
+        df[["Super Structure Name", "Super Structure ID"]].set_axis(["name", "id"], axis=1),
+        df[["Sub Structure Name", "Sub Structure ID"]].set_axis(["name", "id"], axis=1),
+    ]).dropna().drop_duplicates("name")
+
+    names = {
+        "genes": dict(zip(genes["Gene Symbol"], genes["Gene ID"])),
+        "structures": dict(zip(structures["name"], structures["id"])),
+    }
+    with open(names_path + ".tmp", "w") as f:
+        json.dump(names, f, separators=(",", ":"))
+
+    # size lets the dashboard notice that evidence.tsv was rebuilt under it
+    index = {"fields": evidence_fields, "blocks": blocks, "size": offset}
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(index, f, separators=(",", ":"))
+
+    for path in paths:
+        os.replace(path + ".tmp", path)
+    return len(cells), len(blocks)
+
+
+def lookup(gene_id, structure_id, output_dir=OUTPUT_DIR, index=None):
+    """Return the evidence records for one cell as dicts (empty list if none)."""
+    if index is None:
+        with open(os.path.join(output_dir, INDEX_FILE)) as f:
+            index = json.load(f)
+    blocks = index["blocks"]
+    i = bisect_right([(b[0], b[1]) for b in blocks], (gene_id, structure_id)) - 1
+    if i < 0:
+        return []
+
+    _, _, offset, length = blocks[i]
+    with open(os.path.join(output_dir, EVIDENCE_FILE), "rb") as f:
+        f.seek(offset)
+        block = f.read(length).decode("utf-8")
+    for line in block.splitlines():
+        line_gene, line_structure, evidence = line.split("\t", 2)
+        if (line_gene, line_structure) == (gene_id, structure_id):
+            return [dict(zip(index["fields"], record)) for record in json.loads(evidence)]
+    return []
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        with open(os.path.join(OUTPUT_DIR, NAMES_FILE)) as f:
+            names = json.load(f)
+        gene, structure = sys.argv[1], sys.argv[2]
+        gene_id = names["genes"].get(gene.lower(), gene)
+        structure_id = names["structures"].get(structure, structure)
+        records = lookup(gene_id, structure_id)
+        print(f"🔎 {len(records)} evidence record(s) for {gene_id} x {structure_id}")
+        for record in records:
+            print("  " + " | ".join(f"{k}: {v}" for k, v in record.items() if v))
+    else:
+        print(f"📥 Loading expression data from {DATA_FILE}...")
+        num_cells, num_blocks = write_index(load_source(DATA_FILE))
+        print(f"✅ Indexed {num_cells} gene x structure cells in {num_blocks} block(s)")
+        print("📁 Saved to", OUTPUT_DIR)
@@ -23,20 +23,31 @@ target_genes = {
     "cfb", "cfbl", "cfd", "cfh", "cfhl1", "cfhl2", "cfhl3", "cfhl4", "cfi", "cfp"
 }
 
-# === Load data ===
-print("📥 Loading expression data...")
-df = pd.read_csv(DATA_PATH, sep="\t", header=None, names=column_names, skiprows=2)
 
-# === Standardize gene symbol casing ===
-df["Gene Symbol"] = df["Gene Symbol"].astype(str).str.strip().str.lower()
+def load_expression(path, **read_csv_kwargs):
+    """Load a raw ZFIN expression dump with standardized gene symbol casing."""
+    df = pd.read_csv(path, sep="\t", header=None, names=column_names, skiprows=2, **read_csv_kwargs)
+    df["Gene Symbol"] = df["Gene Symbol"].astype(str).str.strip().str.lower()
+    return df
 
-# === Filter expression data for target complement genes ===
-filtered_df = df[df["Gene Symbol"].isin(target_genes)]
 
-# === Save result ===
-Path(OUTPUT_PATH).parent.mkdir(parents=True, exist_ok=True)
-filtered_df.to_csv(OUTPUT_PATH, index=False)
+def filter_targets(df, genes):
+    """Keep only the rows for the given gene symbols."""
+    return df[df["Gene Symbol"].isin(genes)]
 
-# === Summary ===
-print("✅ Extracted", len(filtered_df), "rows for", len(target_genes), "complement genes")
-print("📁 Saved to", OUTPUT_PATH)
+
+if __name__ == "__main__":
+    # === Load data ===
+    print("📥 Loading expression data...")
+    df = load_expression(DATA_PATH)
+
+    # === Filter expression data for target complement genes ===
+    filtered_df = filter_targets(df, target_genes)
+
+    # === Save result ===
+    Path(OUTPUT_PATH).parent.mkdir(parents=True, exist_ok=True)
+    filtered_df.to_csv(OUTPUT_PATH, index=False)
+
+    # === Summary ===
+    print("✅ Extracted", len(filtered_df), "rows for", len(target_genes), "complement genes")
+    print("📁 Saved to", OUTPUT_PATH)
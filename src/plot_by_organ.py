@@ -44,35 +44,42 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import os
 
-# Load the filtered dataset
-df = pd.read_csv("data/filtered_expression.csv")
 
-# ✅ FILTER: Only adult-stage entries
-df = df[(df["Start Stage"] == "Adult") & (df["End Stage"] == "Adult")]
-
-# ✅ Drop missing values
-df = df.dropna(subset=["Gene Symbol", "Sub Structure Name"])
-
-# ✅ Create a pivot table: rows = genes, columns = organs, values = expression counts
-heatmap_data = df.pivot_table(
-    index="Gene Symbol",
-    columns="Sub Structure Name",
-    aggfunc="size",
-    fill_value=0
-)
-
-# ✅ Plot heatmap
-plt.figure(figsize=(24, 14))
-sns.heatmap(heatmap_data, cmap="YlGnBu", linewidths=0.4, linecolor='gray')
-
-plt.title("🧬 Complement Gene Expression in Organs (Adult Stage)", fontsize=18)
-plt.xlabel("Organ (Sub Structure Name)", fontsize=12)
-plt.ylabel("Gene Symbol", fontsize=12)
-plt.xticks(rotation=45, ha='right')
-plt.yticks(fontsize=8)
-
-# ✅ Save plot
-os.makedirs("plots/summary", exist_ok=True)
-plt.tight_layout()
-plt.savefig("plots/summary/all_genes_by_organ_adult_heatmap.png", dpi=300)
-plt.close()
+def adult_organ_counts(df):
+    """Pivot adult-stage annotations: rows = genes, columns = organs, values = expression counts."""
+    # ✅ FILTER: Only adult-stage entries
+    df = df[(df["Start Stage"] == "Adult") & (df["End Stage"] == "Adult")]
+
+    # ✅ Drop missing values
+    df = df.dropna(subset=["Gene Symbol", "Sub Structure Name"])
+
+    return df.pivot_table(
+        index="Gene Symbol",
+        columns="Sub Structure Name",
+        aggfunc="size",
+        fill_value=0
+    )
+
+
+def plot_adult_organs(heatmap_data):
+    # ✅ Plot heatmap
+    plt.figure(figsize=(24, 14))
+    sns.heatmap(heatmap_data, cmap="YlGnBu", linewidths=0.4, linecolor='gray')
+
+    plt.title("🧬 Complement Gene Expression in Organs (Adult Stage)", fontsize=18)
+    plt.xlabel("Organ (Sub Structure Name)", fontsize=12)
+    plt.ylabel("Gene Symbol", fontsize=12)
+    plt.xticks(rotation=45, ha='right')
+    plt.yticks(fontsize=8)
+
+    # ✅ Save plot
+    os.makedirs("plots/summary", exist_ok=True)
+    plt.tight_layout()
+    plt.savefig("plots/summary/all_genes_by_organ_adult_heatmap.png", dpi=300)
+    plt.close()
+
+
+if __name__ == "__main__":
+    # Load the filtered dataset
+    df = pd.read_csv("data/filtered_expression.csv")
+    plot_adult_organs(adult_organ_counts(df))
@@ -35,19 +35,18 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import os
 
-# Load filtered expression data
-df = pd.read_csv('data/filtered_expression.csv')
+GENE_PLOT_DIR = 'plots/genes'
 
-# Make sure the plots/ directory exists
-os.makedirs('plots/genes', exist_ok=True)
 
-# Get list of unique genes
-genes = df['Gene Symbol'].unique()
+def remove_gene_plot(gene, kind):
+    """Delete a gene's stale plot so plots/genes/ only holds charts with data."""
+    path = f'{GENE_PLOT_DIR}/{gene}_by_{kind}.png'
+    if os.path.exists(path):
+        os.remove(path)
 
-# Loop through each gene
-for gene in genes:
-    gene_df = df[df['Gene Symbol'] == gene]
 
+def plot_gene(gene, gene_df):
+    """Save the by-tissue and by-stage bar charts for one gene."""
     # --- Plot 1: Expression by tissue ---
     tissue_counts = gene_df['Sub Structure Name'].value_counts()
     if not tissue_counts.empty:
@@ -58,8 +57,10 @@ for gene in genes:
         plt.ylabel('Count')
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        plt.savefig(f'plots/genes/{gene}_by_tissue.png')
+        plt.savefig(f'{GENE_PLOT_DIR}/{gene}_by_tissue.png')
         plt.close()
+    else:
+        remove_gene_plot(gene, 'tissue')
 
     # --- Plot 2: Expression by stage ---
     stage_counts = gene_df['Start Stage'].value_counts().sort_index()
@@ -71,7 +72,21 @@ for gene in genes:
         plt.ylabel('Count')
         plt.xticks(rotation=45, ha='right')
         plt.tight_layout()
-        plt.savefig(f'plots/genes/{gene}_by_stage.png')
+        plt.savefig(f'{GENE_PLOT_DIR}/{gene}_by_stage.png')
         plt.close()
+    else:
+        remove_gene_plot(gene, 'stage')
 
-print(f"✅ Done! Plots saved in plots/genes/")
+
+if __name__ == "__main__":
+    # Load filtered expression data
+    df = pd.read_csv('data/filtered_expression.csv')
+
+    # Make sure the plots/ directory exists
+    os.makedirs(GENE_PLOT_DIR, exist_ok=True)
+
+    # Loop through each gene
+    for gene in df['Gene Symbol'].unique():
+        plot_gene(gene, df[df['Gene Symbol'] == gene])
+
+    print(f"✅ Done! Plots saved in plots/genes/")
@@ -0,0 +1,67 @@
+# src/serve_dashboard.py
+#
+# Serves index.html and the evidence index with HTTP Range support, so each
+# heatmap drill-down downloads a single block of dashboard/evidence/evidence.tsv.
+# (python -m http.server ignores Range and would send the whole file.)
+#
+# Usage (from the repository root):
+#     python src/serve_dashboard.py    # then open http://localhost:8000/
+
+import io
+import os
+import re
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = 8000
+RANGE_PATTERN = re.compile(r"bytes=(\d*)-(\d*)$")
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler that answers single byte-range requests with 206."""
+
+    def end_headers(self):
+        self.send_header("Accept-Ranges", "bytes")
+        super().end_headers()
+
+    def send_head(self):
+        match = RANGE_PATTERN.match(self.headers.get("Range", ""))
+        path = self.translate_path(self.path)
+        if not match or not os.path.isfile(path):
+            return super().send_head()
+
+        size = os.path.getsize(path)
+        start, end = match.groups()
+        if start:
+            start = int(start)
+            end = min(int(end), size - 1) if end else size - 1
+        elif end:
+            start = max(size - int(end), 0)  # Suffix range: the last N bytes
+            end = size - 1
+        else:
+            return super().send_head()
+
+        if start > end:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start + 1)
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        return io.BytesIO(data)
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("", PORT), RangeRequestHandler)
+    print(f"🌐 Serving dashboard at http://localhost:{PORT}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped serving.")
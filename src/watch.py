@@ -0,0 +1,226 @@
+# src/watch.py
+#
+# Long-running watch mode for the dashboard figures.
+#
+# Keeps the filtered expression table and its aggregates in memory, polls
+# data/ and the complement panel (target_genes in filter_expression.py) for
+# changes, and re-renders only the figures whose inputs actually changed.
+#
+# Usage (from the repository root):
+#     python src/watch.py
+
+import ast
+import glob
+import os
+import time
+
+import matplotlib
+matplotlib.use("Agg")  # Headless backend: the daemon never opens windows
+
+import pandas as pd
+
+from bubblemap import plot_bubblemap
+from clustermap import plot_clustermap
+from evidence_index import write_index
+from filter_expression import filter_targets, load_expression
+from heatmap import plot_heatmap
+from plot_by_organ import adult_organ_counts, plot_adult_organs
+from plot_expression import GENE_PLOT_DIR, plot_gene, remove_gene_plot
+
+# --- Configuration ---
+RAW_DATA_PATTERN = "data/wildtype-expression_fish_*.txt"
+DATA_FILE = "data/filtered_expression.csv"
+PANEL_FILE = "src/filter_expression.py"
+SUMMARY_DIR = "plots/summary"
+
+POLL_INTERVAL = 1.0  # Seconds between checks of the watched files
+DEBOUNCE = 2.0       # Seconds the files must stay unchanged before rebuilding
+
+
+# --- Loading ---
+def read_setting(name):
+    """Read a literal setting out of filter_expression.py without running it."""
+    with open(PANEL_FILE) as f:
+        tree = ast.parse(f.read(), PANEL_FILE)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(t, ast.Name) and t.id == name for t in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise ValueError(f"No {name} setting found in {PANEL_FILE}")
+
+
+def load_panel():
+    return set(read_setting("target_genes"))
+
+
+def find_raw_dump():
+    """Newest dated ZFIN dump in data/, falling back to DATA_PATH in filter_expression.py."""
+    dumps = sorted(glob.glob(RAW_DATA_PATTERN))
+    if dumps:
+        return dumps[-1]
+    path = read_setting("DATA_PATH")
+    return path if os.path.exists(path) else None
+
+
+def load_filtered():
+    df = pd.read_csv(DATA_FILE)
+    df.columns = df.columns.str.strip()
+    return df
+
+
+# --- Aggregates ---
+def gene_signatures(df):
+    """One hash per gene, so we can tell which genes' rows changed between builds."""
+    row_hashes = pd.util.hash_pandas_object(df, index=False)
+    return row_hashes.groupby(df["Gene Symbol"].values).sum().to_dict()
+
+
+def super_structure_counts(df):
+    return df.dropna(subset=["Gene Symbol", "Super Structure Name"]).pivot_table(
+        index="Gene Symbol",
+        columns="Super Structure Name",
+        aggfunc="size",
+        fill_value=0
+    )
+
+
+def same_table(old, new):
+    return old is not None and old.shape == new.shape and old.equals(new)
+
+
+# --- Watch loop ---
+class ExpressionWatcher:
+    """Holds the parsed tables and aggregates between rebuilds."""
+
+    def __init__(self):
+        self.raw = None
+        self.raw_path = None
+        self.panel = None
+        self.df = None
+        self.signatures = {}
+        self.super_counts = None
+        self.adult_counts = None
+        self.mtimes = {}
+
+    def snapshot(self):
+        """Modification times of every watched file (None if it does not exist)."""
+        paths = [PANEL_FILE] + [os.path.join("data", name) for name in sorted(os.listdir("data"))]
+        mtimes = {}
+        for path in paths:
+            try:
+                mtimes[path] = os.path.getmtime(path)
+            except OSError:
+                # Deleted or mid-replace (e.g. an editor's atomic save); the
+                # next poll sees the new file and the debounce waits for it.
+                mtimes[path] = None
+        return mtimes
+
+    def reload(self, changed):
+        """Refresh only the inputs that changed; return the new filtered table."""
+        raw_path = find_raw_dump()
+        raw_changed = raw_path is not None and (raw_path != self.raw_path or raw_path in changed)
+        if raw_changed:
+            print(f"📥 Loading {raw_path}...")
+            self.raw = load_expression(raw_path)
+            self.raw_path = raw_path
+        if self.panel is None or PANEL_FILE in changed:
+            self.panel = load_panel()
+
+        if raw_path is not None and (raw_changed or PANEL_FILE in changed or self.df is None):
+            filter_targets(self.raw, self.panel).to_csv(DATA_FILE, index=False)
+            self.mtimes[DATA_FILE] = os.path.getmtime(DATA_FILE)  # Don't react to our own write
+            return load_filtered()  # Round-trip so dtypes match the plotting scripts
+        if DATA_FILE not in changed and PANEL_FILE not in changed and self.df is not None:
+            return self.df
+
+        df = load_filtered()
+        if raw_path is None:
+            # Without a raw dump the filtered CSV is the only source, so the
+            # panel can narrow it but genes missing from it can't be added.
+            missing = self.panel - set(df["Gene Symbol"])
+            if missing:
+                print(f"⚠️ No raw ZFIN dump in data/; can't add {', '.join(sorted(missing))} to the panel")
+            df = filter_targets(df, self.panel)
+        return df
+
+    def rebuild(self, changed):
+        df = self.reload(changed)
+        started = time.time()
+        rendered = 0
+
+        # Per-gene figures: only genes whose rows changed
+        signatures = gene_signatures(df)
+        for gene, signature in signatures.items():
+            if self.signatures.get(gene) != signature:
+                plot_gene(gene, df[df["Gene Symbol"] == gene])
+                rendered += 1
+        for gene in set(self.signatures) - set(signatures):
+            remove_gene_plot(gene, "tissue")
+            remove_gene_plot(gene, "stage")
+            print(f"🗑️ Removed plots for {gene}")
+
+        # Summary figures: only when their aggregate changed
+        super_counts = super_structure_counts(df)
+        if not super_counts.empty and not same_table(self.super_counts, super_counts):
+            plot_heatmap(super_counts)
+            plot_bubblemap(super_counts)
+            plot_clustermap(super_counts)
+            rendered += 3
+
+        adult_counts = adult_organ_counts(df)
+        if not adult_counts.empty and not same_table(self.adult_counts, adult_counts):
+            plot_adult_organs(adult_counts)
+            rendered += 1
+
+        # Keep the dashboard's drill-down index in step with the table
+        if signatures != self.signatures:
+            num_cells, _ = write_index(df)
+            print(f"🔎 Rebuilt evidence index ({num_cells} cells)")
+
+        self.df = df
+        self.signatures = signatures
+        self.super_counts = super_counts
+        self.adult_counts = adult_counts
+        print(f"✅ Re-rendered {rendered} figure group(s) in {time.time() - started:.1f}s")
+
+    def run(self):
+        os.makedirs(GENE_PLOT_DIR, exist_ok=True)
+        os.makedirs(SUMMARY_DIR, exist_ok=True)
+
+        # self.mtimes always holds the snapshot a rebuild started from, so
+        # edits saved while it runs still differ and trigger the next one.
+        self.mtimes = self.snapshot()
+        self.rebuild(set(self.mtimes))
+        print(f"👀 Watching data/ and {PANEL_FILE} (Ctrl+C to stop)")
+
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = self.snapshot()
+            if current == self.mtimes:
+                continue
+
+            # Debounce: wait until the files stop changing
+            settled_at = time.time()
+            while time.time() - settled_at < DEBOUNCE:
+                time.sleep(POLL_INTERVAL)
+                latest = self.snapshot()
+                if latest != current:
+                    current = latest
+                    settled_at = time.time()
+
+            changed = {path for path in set(current) | set(self.mtimes)
+                       if current.get(path) != self.mtimes.get(path)}
+            print(f"🔁 Change detected: {', '.join(sorted(changed))}")
+            self.mtimes = current
+            try:
+                self.rebuild(changed)
+            except Exception as e:
+                print(f"An error occurred while rebuilding: {e}")
+
+
+if __name__ == "__main__":
+    try:
+        ExpressionWatcher().run()
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching.")